@@ -0,0 +1,79 @@
+import numpy
+from threading import Event
+# > Typing
+from typing import Optional, Tuple, List
+
+# ! Functions
+def aligned_empty(shape: Tuple[int, ...], dtype: str="float32", alignment: int=64) -> numpy.ndarray:
+    dtype = numpy.dtype(dtype)
+    size = int(numpy.prod(shape)) * dtype.itemsize
+    raw = numpy.empty(size + alignment, dtype=numpy.uint8)
+    offset = -raw.ctypes.data % alignment
+    return raw[offset:offset + size].view(dtype).reshape(shape)
+
+# ! Main Class
+class RingBuffer():
+    """Single-producer/single-consumer ring of preallocated sound chunks."""
+    def __init__(
+        self,
+        depth: int,
+        frames: int,
+        channels: int,
+        dtype: str="float32"
+    ) -> None:
+        self.depth = depth
+        self.frames = frames
+        self.slots = aligned_empty((depth, frames, channels), dtype)
+        self.lengths: List[int] = [0] * depth
+        self.marks: List[Tuple[int, ...]] = [()] * depth
+        # * `head` is moved only by the producer and `tail` only by the consumer
+        self.head = 0
+        self.tail = 0
+        self.closed = False
+        self.__readable = Event()
+        self.__writable = Event()
+    
+    # ! Main Methods
+    def reset(self) -> None:
+        self.head, self.tail, self.closed = 0, 0, False
+        self.__readable.clear()
+        self.__writable.clear()
+    
+    def close(self) -> None:
+        self.closed = True
+        self.__readable.set()
+        self.__writable.set()
+    
+    # ! Producer Methods
+    def acquire(self) -> Optional[numpy.ndarray]:
+        while (self.head - self.tail >= self.depth) and (not self.closed):
+            self.__writable.clear()
+            if self.head - self.tail < self.depth:
+                break
+            self.__writable.wait()
+        if self.closed:
+            return None
+        return self.slots[self.head % self.depth]
+    
+    def commit(self, length: int, mark: Tuple[int, ...]=()) -> None:
+        index = self.head % self.depth
+        self.lengths[index], self.marks[index] = length, mark
+        self.head += 1
+        self.__readable.set()
+    
+    # ! Consumer Methods
+    def peek(self) -> Optional[Tuple[int, Tuple[int, ...], numpy.ndarray]]:
+        while (self.head == self.tail) and (not self.closed):
+            self.__readable.clear()
+            if self.head != self.tail:
+                break
+            self.__readable.wait()
+        if self.closed:
+            return None
+        index = self.tail % self.depth
+        length, slot = self.lengths[index], self.slots[index]
+        return length, self.marks[index], slot if length == self.frames else slot[:length]
+    
+    def release(self) -> None:
+        self.tail += 1
+        self.__writable.set()
@@ -1,90 +1,217 @@
 import os
-import time
-from threading import Thread
+import shutil
+import numpy
+from queue import SimpleQueue
+from threading import Thread, Event
 from tempfile import mkstemp
 from soundfile import SoundFile
 from mutagen import File, FileType
 from io import BytesIO, BufferedReader, BufferedRandom
-from pathlib import Path, PosixPath, PurePath, PurePosixPath, PureWindowsPath, WindowsPath
+from pathlib import PurePath
 # > Typing
-from typing import Type, Union, Optional, Tuple, Dict
+from typing import Type, Union, Optional, Tuple, Dict, Callable, TypeVar
 # > Local Imports
 from . import fluidsynth
+from .ring import RingBuffer
 from .units import DEFAULT_SOUND_FONTS_PATH
 from .streamers import StreamerBase, DEFAULT_STREAMER
 from .exceptions import FileTypeError, FluidSynthNotFoundError, FluidSynthRuntimeError, DefaultStreamerImportError
 
+# ! Constants
+RING_DEPTH = 8
+DEFAULT_BLOCKSIZE = 2048
+MIN_BLOCKSIZE = 256
+COPY_BLOCKSIZE = 1024 * 1024
+MIDI_MAGIC = b"MThd"
+CACHE_LIMIT = 16 * 1024 * 1024
+NO_TAG_EXTENSIONS = frozenset({".wav", ".aif", ".aiff", ".raw"})
+# > Worker Commands
+PLAY = "PLAY"
+QUIT = "QUIT"
+PCM_SUBTYPES = frozenset({"PCM_S8", "PCM_U8", "PCM_16", "PCM_24", "PCM_32", "FLOAT", "DOUBLE"})
+SUBTYPE_BIT_DEPTHS: Dict[str, int] = {
+    "PCM_S8": 8, "PCM_U8": 8, "PCM_16": 16, "PCM_24": 24, "PCM_32": 32,
+    "FLOAT": 32, "DOUBLE": 64,
+    "ALAC_16": 16, "ALAC_20": 20, "ALAC_24": 24, "ALAC_32": 32,
+    "DWVW_12": 12, "DWVW_16": 16, "DWVW_24": 24,
+    "DPCM_8": 8, "DPCM_16": 16
+}
+
 # ! Types
-FPType = Union[str, Path, bytes, BytesIO, BufferedReader, BufferedRandom]
+T = TypeVar('T')
+FPType = Union[str, PurePath, bytes, BytesIO, BufferedReader, BufferedRandom]
 MutagenFile = FileType
 
 # ! Hidden Functions For Class
-def opener(fp: FPType) -> Tuple[Optional[str], SoundFile, MutagenFile, bool]:
-    if isinstance(fp, str):
-        fp = os.path.abspath(fp)
-        return fp, SoundFile(fp), File(fp), False
-    elif isinstance(fp, (Path, PosixPath, PurePath, PurePosixPath, PureWindowsPath, WindowsPath)):
-        fp = os.path.abspath(str(fp))
-        return fp, SoundFile(fp), File(fp), False
+def _dispatch(handlers: Dict[type, Callable[..., T]], fp: FPType) -> Callable[..., T]:
+    handler = handlers.get(type(fp), None)
+    if handler is None:
+        for cls in type(fp).__mro__:
+            if cls in handlers:
+                # * Subclasses (e.g. `PosixPath`) are remembered, so the MRO is walked only once
+                handler = handlers[type(fp)] = handlers[cls]
+                break
+        else:
+            raise TypeError(f"The fp argument cannot be: {type(fp)}")
+    return handler
+
+def _check_closed(fp: Union[BytesIO, BufferedReader, BufferedRandom]) -> None:
+    if fp.closed:
+        raise RuntimeError("Closed IO cannot be used.")
+
+def _abspath(fp: Union[str, PurePath]) -> str:
+    # * `os.path.abspath` calls `os.getcwd` even when it is not needed
+    path = os.fspath(fp)
+    return path if os.path.isabs(path) else os.path.abspath(path)
+
+def _open_path(fp: Union[str, PurePath]) -> Tuple[Optional[str], SoundFile]:
+    name = _abspath(fp)
+    return name, SoundFile(name)
+
+def _open_bytes(fp: bytes) -> Tuple[Optional[str], SoundFile]:
+    return None, SoundFile(BytesIO(fp))
+
+def _open_bytesio(fp: BytesIO) -> Tuple[Optional[str], SoundFile]:
+    _check_closed(fp)
+    return None, SoundFile(fp)
+
+def _open_buffered(fp: Union[BufferedReader, BufferedRandom]) -> Tuple[Optional[str], SoundFile]:
+    _check_closed(fp)
+    name = fp.name if isinstance(fp.name, str) else None
+    return name, SoundFile(fp)
+
+def _getfp_path(fp: Union[str, PurePath], filetype: str) -> Tuple[str, bool]:
+    return _abspath(fp), False
+
+def _getfp_bytes(fp: bytes, filetype: str) -> Tuple[str, bool]:
+    code, path = mkstemp(suffix=filetype)
+    with os.fdopen(code, "wb") as file:
+        file.write(fp)
+    return path, True
+
+def _getfp_bytesio(fp: BytesIO, filetype: str) -> Tuple[str, bool]:
+    _check_closed(fp)
+    code, path = mkstemp(suffix=filetype)
+    with os.fdopen(code, "wb") as file, fp.getbuffer() as view:
+        file.write(view)
+    return path, True
+
+def _getfp_buffered(fp: Union[BufferedReader, BufferedRandom], filetype: str) -> Tuple[str, bool]:
+    if fp.closed:
+        return fp.name, False
+    code, path = mkstemp(suffix=filetype)
+    with os.fdopen(code, "wb") as file:
+        fp.seek(0)
+        shutil.copyfileobj(fp, file, COPY_BLOCKSIZE)
+    return path, True
+
+def _peek_path(fp: Union[str, PurePath], size: int) -> bytes:
+    with open(_abspath(fp), "rb") as file:
+        return file.read(size)
+
+def _peek_bytes(fp: bytes, size: int) -> bytes:
+    return fp[:size]
+
+def _peek_bytesio(fp: BytesIO, size: int) -> bytes:
+    _check_closed(fp)
+    return fp.getvalue()[:size]
+
+def _peek_buffered(fp: Union[BufferedReader, BufferedRandom], size: int) -> bytes:
+    if fp.closed:
+        return _peek_path(fp.name, size)
+    position = fp.tell()
+    try:
+        fp.seek(0)
+        return fp.read(size)
+    finally:
+        fp.seek(position)
+
+_OPENERS: Dict[type, Callable[..., Tuple[Optional[str], SoundFile]]] = {
+    str: _open_path,
+    PurePath: _open_path,
+    bytes: _open_bytes,
+    BytesIO: _open_bytesio,
+    BufferedReader: _open_buffered,
+    BufferedRandom: _open_buffered
+}
+_GETTERS: Dict[type, Callable[..., Tuple[str, bool]]] = {
+    str: _getfp_path,
+    PurePath: _getfp_path,
+    bytes: _getfp_bytes,
+    BytesIO: _getfp_bytesio,
+    BufferedReader: _getfp_buffered,
+    BufferedRandom: _getfp_buffered
+}
+_PEEKERS: Dict[type, Callable[..., bytes]] = {
+    str: _peek_path,
+    PurePath: _peek_path,
+    bytes: _peek_bytes,
+    BytesIO: _peek_bytesio,
+    BufferedReader: _peek_buffered,
+    BufferedRandom: _peek_buffered
+}
+
+def _peek_magic(fp: FPType, size: int=4) -> bytes:
+    return _dispatch(_PEEKERS, fp)(fp, size)
+
+def opener(fp: FPType, metadata: bool=True) -> Tuple[Optional[str], SoundFile, Optional[MutagenFile], bool]:
+    name, sf = _dispatch(_OPENERS, fp)(fp)
+    return name, sf, open_mutagen(fp, name) if metadata else None, False
+
+def open_mutagen(fp: FPType, name: Optional[str]=None) -> Optional[MutagenFile]:
+    # * Only paths and in-memory snapshots are safe to read while the SoundFile is playing `fp`
+    if name is not None:
+        # * Everything needed from these formats is already known by `SoundFile`
+        if os.path.splitext(name)[1].lower() in NO_TAG_EXTENSIONS:
+            return None
+        return File(name)
     elif isinstance(fp, bytes):
-        bio = BytesIO(fp)
-        return None, SoundFile(bio), File(bio), False
+        return File(BytesIO(fp))
     elif isinstance(fp, BytesIO):
-        if fp.closed:
-            raise RuntimeError("Closed IO cannot be used.")
-        return None, SoundFile(fp), File(fp), False
-    elif isinstance(fp, (BufferedReader, BufferedRandom)):
-        if fp.closed:
-            raise RuntimeError("Closed IO cannot be used.")
-        name = fp.name if isinstance(fp.name, str) else None
-        return name, SoundFile(fp), File(fp), False
+        return File(BytesIO(fp.getvalue()))
     else:
-        raise TypeError(f"The fp argument cannot be: {type(fp)}")
+        # * A buffered stream without a path, which `Sound` only reads before playback starts
+        position = fp.tell()
+        try:
+            fp.seek(0)
+            return File(fp)
+        finally:
+            fp.seek(position)
 
 def getfp(fp: FPType, filetype: str=".bin") -> Tuple[str, bool]:
-    if isinstance(fp, str):
-        return os.path.abspath(fp), False
-    elif isinstance(fp, (Path, PosixPath, PurePath, PurePosixPath, PureWindowsPath, WindowsPath)):
-        return os.path.abspath(str(fp)), False
-    elif isinstance(fp, bytes):
-        code, path = mkstemp(suffix=filetype)
-        with open(path, "wb+") as file:
-            file.write(fp)
-        return path, True
-    elif isinstance(fp, BytesIO):
-        if fp.closed:
-            raise RuntimeError("Closed IO cannot be used.")
-        code, path = mkstemp(suffix=filetype)
-        with open(path, "wb+") as file:
-            fp.seek(0)
-            file.write(fp.read())
-        return path, True
-    elif isinstance(fp, (BufferedReader, BufferedRandom)):
-        if fp.closed:
-            path, is_temp = fp.name, False
-        else:
-            code, path = mkstemp(suffix=filetype)
-            with open(path, "wb+") as file:
-                fp.seek(0)
-                file.write(fp.read())
-            is_temp = True
-        return path, is_temp
-    else:
-        raise TypeError(f"The fp argument cannot be: {type(fp)}")
+    return _dispatch(_GETTERS, fp)(fp, filetype)
 
 # ! Sound Functions
-def get_icon_data(mutagen_class: MutagenFile) -> Optional[bytes]:
+def get_icon_data(mutagen_class: Optional[MutagenFile]) -> Optional[bytes]:
+    tags = getattr(mutagen_class, "tags", None)
+    if tags is None:
+        return None
+    for key in ("APIC:", "APIC"):
+        frame = tags.get(key, None)
+        if frame is not None:
+            return frame.data
+    return None
+
+def scale(data: numpy.ndarray, volume: float) -> None:
+    numpy.multiply(data, volume, out=data, casting="unsafe")
+
+def _work(commands: SimpleQueue, method: str, finished: Event) -> None:
+    # * The `Sound` is only referenced by a pending or running command, so an idle one can still be collected
     try:
-        return mutagen_class["APIC:"].data
-    except:
-        try:
-            return mutagen_class["APIC"].data
-        except:
-            pass
+        while True:
+            command, arg, sound = commands.get()
+            if command == QUIT:
+                break
+            try:
+                getattr(sound, method)(arg)
+            finally:
+                sound = None
+                finished.set()
+    finally:
+        finished.set()
 
-def is_midi_file(filepath: str) -> bool:
-    with open(filepath, 'rb') as file:
-        return file.read(4) == b"MThd"
+def is_midi_file(filepath: FPType) -> bool:
+    return _peek_magic(filepath) == MIDI_MAGIC
 
 # ! Main Class
 class Sound():
@@ -95,12 +222,18 @@ class Sound():
         volume: float=1.0,
         is_temp: bool=False,
         streamer: Optional[Type[StreamerBase]]=DEFAULT_STREAMER,
+        lazy_metadata: bool=True,
         **kwargs
     ) -> None:
         if streamer is None:
             raise DefaultStreamerImportError()
         self.kwargs = kwargs
-        self.__name, self.sf, self.mf, self.is_temp = opener(fp)
+        self.__fp = fp
+        self.__name, self.sf, self.__mf, self.is_temp = opener(fp, not lazy_metadata)
+        self.__mf_loaded = not lazy_metadata
+        if (not self.__mf_loaded) and (self.__name is None) and isinstance(fp, (BufferedReader, BufferedRandom)):
+            # * Without a path mutagen has to read the stream shared with the decoder, so it is done before playback
+            self.__mf, self.__mf_loaded = open_mutagen(fp), True
         self.is_temp = self.is_temp or is_temp
         # ! Sound Settings
         self.__dtype = dtype
@@ -108,37 +241,66 @@ class Sound():
         self.__channels: int = self.sf.channels
         self.__max_frame: int = self.sf.frames
         self.__duration: float = self.__max_frame / self.__samplerate
-        try:
-            self.__bitrate: int = int(self.mf.info.bitrate)
-        except:
-            self.__bitrate: int = 0
-        self.__bit_depth: int = round(self.__bitrate / (self.__samplerate * self.__channels))
+        self.__inv_samplerate: float = 1.0 / self.__samplerate
+        # * PCM-like subtypes give the bit depth without parsing the container with mutagen
+        self.__bitrate: Optional[int] = None
+        self.__bit_depth: Optional[int] = SUBTYPE_BIT_DEPTHS.get(self.sf.subtype, None)
+        if (self.sf.subtype in PCM_SUBTYPES) and (self.sf.format != "FLAC"):
+            # * Uncompressed PCM has a fixed bitrate
+            self.__bitrate = self.__samplerate * self.__channels * self.__bit_depth
+        if not lazy_metadata:
+            self.__bitrate, self.__bit_depth = self.bitrate, self.bit_depth
         # ! Sound Runtime
+        # * A power of 2 frames matches the period sizes of audio devices
+        self.__supply = 1 << (max(self.kwargs.get("blocksize", DEFAULT_BLOCKSIZE), MIN_BLOCKSIZE).bit_length() - 1)
         self.__streamer = streamer(
             self.__samplerate,
             self.__channels,
             dtype=self.__dtype,
-            device=self.kwargs.get("device")
+            device=self.kwargs.get("device"),
+            blocksize=self.__supply
         )
-        self.__thread = None
+        self.__worker: Optional[Thread] = None
+        self.__decoder: Optional[Thread] = None
+        self.__commands: SimpleQueue = SimpleQueue()
+        self.__decoder_commands: SimpleQueue = SimpleQueue()
+        self.__decoded = Event()
+        self.__decoded.set()
         self.__volume = volume
         self.__cur_frame: int = 0
         self.__playing = False
         self.__paused = False
-        self.__supply = round(self.__samplerate / 10)
+        self.__unpaused = Event()
+        self.__unpaused.set()
+        self.__done = Event()
+        self.__done.set()
+        self.__ring = RingBuffer(RING_DEPTH, self.__supply, self.__channels, self.__dtype)
+        self.__epoch: int = 0
+        self.__seek_frame: int = 0
+        self.__seeked = Event()
+        self.__pass_mode: int = 0
+        self.__cache: Optional[numpy.ndarray] = None
         # ! Sound Metadata
-        self.__icon_data = get_icon_data(self.mf)
-        self.__metadata: Dict[str, str] = self.sf.copy_metadata()
+        # * Filled on first access, cover art can take megabytes to parse
+        self.__icon_data: Optional[bytes] = None
+        self.__icon_loaded = False
+        self.__metadata: Optional[Dict[str, str]] = None
+        self.__tags: Dict[str, Optional[str]] = {}
     
     def __del__(self) -> None:
-        if not self.sf.closed:
-            self.sf.close()
-        if self.is_temp:
-            if self.__name is not None:
-                try:
-                    os.remove(self.__name)
-                except:
-                    pass
+        try:
+            self._release()
+        except:
+            pass
+    
+    # ! Metadata Functions
+    def _get_tag(self, key: str) -> Optional[str]:
+        if self.__metadata is not None:
+            return self.__metadata.get(key, None)
+        # * `SoundFile` reads a single string from libsndfile, without building the whole dict
+        if key not in self.__tags:
+            self.__tags[key] = getattr(self.sf, key) or None
+        return self.__tags[key]
     
     # ! Propertyes
     @property
@@ -152,21 +314,47 @@ class Sound():
     @property
     def name(self) -> Optional[str]: return self.__name
     @property
-    def bit_depth(self) -> int: return self.__bit_depth
+    def mf(self) -> Optional[MutagenFile]:
+        if not self.__mf_loaded:
+            self.__mf, self.__mf_loaded = open_mutagen(self.__fp, self.__name), True
+        return self.__mf
+    @property
+    def bit_depth(self) -> int:
+        if self.__bit_depth is None:
+            self.__bit_depth = round(self.bitrate / (self.__samplerate * self.__channels))
+        return self.__bit_depth
     @property
-    def bitrate(self) -> int: return self.__bitrate
+    def bitrate(self) -> int:
+        if self.__bitrate is None:
+            bit_depth = SUBTYPE_BIT_DEPTHS.get(self.sf.subtype, None)
+            if (self.mf is None) and (bit_depth is not None):
+                self.__bitrate = self.__samplerate * self.__channels * bit_depth
+            else:
+                try:
+                    self.__bitrate = int(self.mf.info.bitrate)
+                except:
+                    self.__bitrate = 0
+        return self.__bitrate
     @property
     def channels(self) -> int: return self.__channels
     @property
-    def title(self) -> Optional[str]: return self.__metadata.get("title", None)
+    def metadata(self) -> Dict[str, str]:
+        if self.__metadata is None:
+            self.__metadata = self.sf.copy_metadata()
+        return self.__metadata
+    @property
+    def title(self) -> Optional[str]: return self._get_tag("title")
     @property
-    def artist(self) -> Optional[str]: return self.__metadata.get("artist", None)
+    def artist(self) -> Optional[str]: return self._get_tag("artist")
     @property
-    def album(self) -> Optional[str]: return self.__metadata.get("album", None)
+    def album(self) -> Optional[str]: return self._get_tag("album")
     @property
-    def year(self) -> Optional[str]: return self.__metadata.get("date", None)
+    def year(self) -> Optional[str]: return self._get_tag("date")
     @property
-    def icon_data(self) -> Optional[bytes]: return self.__icon_data
+    def icon_data(self) -> Optional[bytes]:
+        if not self.__icon_loaded:
+            self.__icon_data, self.__icon_loaded = get_icon_data(self.mf), True
+        return self.__icon_data
     
     # ! Variants
     @staticmethod
@@ -176,9 +364,10 @@ class Sound():
         **kwargs
     ) -> None:
         if fluidsynth.is_exists_fluidsynth():
-            path, is_temp = getfp(fp, ".midi")
-            if not is_midi_file(path):
+            # * The magic number is checked before a temporary file is written
+            if not is_midi_file(fp):
                 raise FileTypeError(fp)
+            path, is_temp = getfp(fp, ".midi")
             npath = mkstemp(suffix=".wav")[1]
             if fluidsynth.midi2wave(path, npath, sound_fonts_path):
                 if is_temp:
@@ -197,8 +386,8 @@ class Sound():
                 repr(self.__name),
                 repr(self.__samplerate),
                 repr(self.__channels),
-                repr(self.__bitrate),
-                repr(self.__bit_depth),
+                repr(self.__bitrate) if self.__bitrate is not None else "<not loaded>",
+                repr(self.__bit_depth) if self.__bit_depth is not None else "<not loaded>",
                 repr(self.__duration),
                 repr(self.__playing),
                 repr(self.__paused)
@@ -207,41 +396,119 @@ class Sound():
     def __repr__(self) -> str:
         return self.__str__()
     
-    def __del__(self) -> None:
-        self.__playing, self.__paused = False, False
-        if self.is_temp:
-            try:
-                if self.name is not None:
-                    os.remove()
-            except:
-                pass
+    def __enter__(self) -> "Sound":
+        return self
+    
+    def __exit__(self, *args) -> None:
+        self.close()
     
     # ! Streaming Functions
+    def _start_workers(self) -> None:
+        if (self.__worker is None) or (not self.__worker.is_alive()):
+            self.__worker = Thread(
+                target=_work,
+                args=(self.__commands, "__streaming__", self.__done),
+                daemon=True
+            )
+            self.__worker.start()
+        if (self.__decoder is None) or (not self.__decoder.is_alive()):
+            self.__decoder = Thread(
+                target=_work,
+                args=(self.__decoder_commands, "__decoding__", self.__decoded),
+                daemon=True
+            )
+            self.__decoder.start()
+    
     def _check_pause(self) -> None:
-        while self.__paused:
-            time.sleep(0.001)
+        self.__unpaused.wait()
     
     # ! Streaming
+    def __decoding__(self, mode: int) -> None:
+        ring, dtype, max_frame = self.__ring, self.__dtype, self.__max_frame
+        read, supply = self.sf.buffer_read_into, self.__supply
+        cache, filling, filled = self.__cache, None, 0
+        if cache is not None:
+            max_frame = len(cache)
+        elif (mode not in (0, 1)) and (max_frame * self.__channels * numpy.dtype(dtype).itemsize <= CACHE_LIMIT):
+            # * Looped small files are kept while they are decoded, later passes copy them from memory
+            filling = numpy.empty((max_frame, self.__channels), dtype=dtype)
+        epoch, frame = self.__epoch, self.__cur_frame
+        if cache is None:
+            self.sf.seek(frame)
+        while not ring.closed:
+            if epoch != self.__epoch:
+                # * The seek applies to the pass being heard, which can be behind the decoded one
+                epoch, frame, mode = self.__epoch, self.__seek_frame, self.__pass_mode
+                if cache is None:
+                    self.sf.seek(frame)
+            if mode == 0:
+                # * The end is already in the ring, only a seek can bring more data
+                self.__seeked.clear()
+                if (epoch == self.__epoch) and (not ring.closed):
+                    self.__seeked.wait()
+                continue
+            buffer = ring.acquire()
+            if buffer is None:
+                break
+            if cache is None:
+                length = read(buffer, dtype)
+                if (filling is not None) and (frame <= filled < frame + length):
+                    end = min(frame + length, max_frame)
+                    filling[filled:end] = buffer[filled - frame:end - frame]
+                    filled = end
+            else:
+                # * Every chunk is full except the tail one
+                remaining = max_frame - frame
+                length = supply if remaining >= supply else max(remaining, 0)
+                buffer[:length] = cache[frame:frame + length]
+            if length != 0:
+                ring.commit(length, (epoch, mode, frame))
+                frame += length
+                # * Like `SoundFile.blocks()`, the end is known from the frame count without an empty read
+                if frame < max_frame:
+                    continue
+            if (filling is not None) and (filled == frame):
+                self.__cache = cache = filling[:filled]
+                max_frame, filling = filled, None
+            mode -= 1
+            if mode != 0:
+                if cache is None:
+                    self.sf.seek(0)
+                frame = 0
+            elif ring.acquire() is not None:
+                ring.commit(0, (epoch, mode, frame))
+    
     def __streaming__(self, mode: int) -> None:
+        # * Hot loop callables are bound once, so that each chunk costs only the C calls
+        ring, send = self.__ring, self.__streamer.send
+        check_pause = self._check_pause
+        ring.reset()
+        self.__pass_mode = mode
+        self.__decoded.clear()
         self.__streamer.start()
-        self.sf.seek(self.__cur_frame)
-        while (mode != 0) and (self.__playing):
-            while self.__playing:
-                self._check_pause()
-                data = self.sf.read(self.__supply, self.__dtype)
-                length = len(data)
-                if length != 0:
-                    self.__streamer.send(data * self.__volume)
-                    self.__cur_frame += length
-                else:
+        self.__decoder_commands.put((PLAY, mode, self))
+        while self.__playing:
+            check_pause()
+            chunk = ring.peek()
+            if chunk is None:
+                break
+            length, (epoch, pass_mode, start), data = chunk
+            if epoch == self.__epoch:
+                if length == 0:
+                    ring.release()
                     break
-            self.sf.seek(0)
-            self.__cur_frame, mode = 0, mode-1
-        self.sf.seek(0)
+                scale(data, self.__volume)
+                send(data)
+                self.__cur_frame, self.__pass_mode = start + length, pass_mode
+            ring.release()
+        ring.close()
+        self.__seeked.set()
+        self.__decoded.wait()
         self.__cur_frame = 0
         self.__streamer.stop()
         self.__playing = False
         self.__paused = False
+        self.__unpaused.set()
     
     # ! Control Functions
     def get_volume(self) -> float:
@@ -251,33 +518,65 @@ class Sound():
         self.__volume = volume
     
     def get_position(self) -> float:
-        return self.__duration * (self.__cur_frame / self.__max_frame)
+        return self.__cur_frame * self.__inv_samplerate
     
     def set_position(self, value: float) -> None:
         if 0.0 <= value <= self.__duration:
-            self.__cur_frame = round(value * self.__samplerate)
-            self.sf.seek(self.__cur_frame)
+            self.__cur_frame = self.__seek_frame = int(value * self.__samplerate)
+            self.__epoch += 1
+            self.__seeked.set()
     
     def pause(self) -> None:
         if not self.__paused and self.__playing:
             self.__paused = True
+            self.__unpaused.clear()
     
     def unpause(self) -> None:
         if self.__paused and self.__playing:
             self.__paused = False
+            self.__unpaused.set()
     
     def play(self, mode: int=1) -> None:
-        if not self.__playing:
+        if (mode != 0) and (not self.__playing):
             self.__playing = True
-            self.__thread = Thread(target=self.__streaming__, args=(mode,))
-            self.__thread.start()
+            self.__done.clear()
+            self._start_workers()
+            self.__commands.put((PLAY, mode, self))
     
     def stop(self) -> None:
         if self.__playing:
             self.__playing, self.__paused = False, False
-            if self.__thread is not None:
-                self.__thread.join()
+            self.__unpaused.set()
+            # * Wakes the streaming thread even if it is waiting on an empty ring
+            self.__ring.close()
+            self.__seeked.set()
+            self.__done.wait()
     
     def wait(self) -> None:
-        while self.__playing:
-            time.sleep(0.001)
+        self.__done.wait()
+    
+    def close(self) -> None:
+        self.stop()
+        self._release()
+    
+    def _release(self) -> None:
+        # * Never waits, so that it is safe to call from `__del__`
+        if self.__worker is not None:
+            self.__commands.put((QUIT, None, None))
+            self.__worker = None
+        if self.__decoder is not None:
+            self.__decoder_commands.put((QUIT, None, None))
+            self.__decoder = None
+        if not self.sf.closed:
+            # * Tags stay readable after closing, as a snapshot
+            if self.__metadata is None:
+                self.__metadata = self.sf.copy_metadata()
+            self.sf.close()
+        self.__mf, self.__mf_loaded = None, True
+        self.__cache = None
+        if self.is_temp and (self.__name is not None):
+            try:
+                os.remove(self.__name)
+            except OSError:
+                pass
+            self.is_temp = False
@@ -1,24 +1,40 @@
-from pathlib import Path
+import numpy
+from pathlib import PurePath
 from mutagen import FileType
 from soundfile import SoundFile
 from io import BytesIO, BufferedReader, BufferedRandom
 # > Typing
-from typing import Type, Union, Optional, Tuple
+from typing import Type, Union, Optional, Tuple, Dict, FrozenSet
 # > Local Imports
 from .units import DEFAULT_SOUND_FONTS_PATH
 from .streamers import DEFAULT_STREAMER, StreamerBase
 
+# ! Constants
+RING_DEPTH: int
+DEFAULT_BLOCKSIZE: int
+MIN_BLOCKSIZE: int
+COPY_BLOCKSIZE: int
+MIDI_MAGIC: bytes
+CACHE_LIMIT: int
+NO_TAG_EXTENSIONS: FrozenSet[str]
+PLAY: str
+QUIT: str
+PCM_SUBTYPES: FrozenSet[str]
+SUBTYPE_BIT_DEPTHS: Dict[str, int]
+
 # ! Types
-FPType = Union[str, Path, bytes, BytesIO, BufferedReader, BufferedRandom]
+FPType = Union[str, PurePath, bytes, BytesIO, BufferedReader, BufferedRandom]
 MutagenFile = FileType
 
 # ! Hidden Functions For Class
-def opener(fp: FPType) -> Tuple[Optional[str], SoundFile, MutagenFile, bool]: ...
+def opener(fp: FPType, metadata: bool=True) -> Tuple[Optional[str], SoundFile, Optional[MutagenFile], bool]: ...
+def open_mutagen(fp: FPType, name: Optional[str]=None) -> Optional[MutagenFile]: ...
 def getfp(fp: FPType, filetype: str=".bin") -> Tuple[str, bool]: ...
 
 # ! Sound Functions
-def get_icon_data(mutagen_class: MutagenFile) -> Optional[bytes]: ...
-def is_midi_file(filepath: str) -> bool: ...
+def get_icon_data(mutagen_class: Optional[MutagenFile]) -> Optional[bytes]: ...
+def scale(data: numpy.ndarray, volume: float) -> None: ...
+def is_midi_file(filepath: FPType) -> bool: ...
 
 # ! Main Class
 class Sound():
@@ -29,9 +45,13 @@ class Sound():
         volume: float=1.0,
         streamer: Optional[Type[StreamerBase]]=DEFAULT_STREAMER,
         is_temp: bool=False,
+        lazy_metadata: bool=True,
         **kwargs
     ) -> None: ...
     
+    # ! Metadata Functions
+    def _get_tag(self, key: str) -> Optional[str]: ...
+    
     # ! Propertyes
     @property
     def playing(self) -> bool: ...
@@ -44,12 +64,16 @@ class Sound():
     @property
     def name(self) -> Optional[str]: ...
     @property
+    def mf(self) -> Optional[MutagenFile]: ...
+    @property
     def bit_depth(self) -> int: ...
     @property
     def bitrate(self) -> int: ...
     @property
     def channels(self) -> int: ...
     @property
+    def metadata(self) -> Dict[str, str]: ...
+    @property
     def title(self) -> Optional[str]: ...
     @property
     def artist(self) -> Optional[str]: ...
@@ -64,10 +88,16 @@ class Sound():
     @staticmethod
     def from_midi(fp: FPType, sound_fonts_path: str=DEFAULT_SOUND_FONTS_PATH, **kwargs): ...
     
+    # ! Magic Methods
+    def __enter__(self) -> Sound: ...
+    def __exit__(self, *args) -> None: ...
+    
     # ! Streaming Functions
+    def _start_workers(self) -> None: ...
     def _check_pause(self) -> None: ...
     
     # ! Streaming
+    def __decoding__(self, mode: int) -> None: ...
     def __streaming__(self, mode: int) -> None: ...
     
     # ! Control Functions
@@ -80,3 +110,5 @@ class Sound():
     def play(self, mode: int=1) -> None: ...
     def stop(self) -> None: ...
     def wait(self) -> None: ...
+    def close(self) -> None: ...
+    def _release(self) -> None: ...
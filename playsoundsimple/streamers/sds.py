@@ -34,7 +34,8 @@ class SoundDeviceStreamer(StreamerBase[ndarray]):
                 samplerate=self.samplerate,
                 channels=self.channels,
                 dtype=self.kwargs.get('dtype'),
-                device=self.kwargs.get('device')
+                device=self.kwargs.get('device'),
+                blocksize=self.kwargs.get('blocksize')
             )
             self.stream.start()
     